@@ -0,0 +1,19 @@
+"""Shared ``UiPath`` client for the runtime hot paths.
+
+Constructing ``UiPath()`` builds config, auth context and HTTP clients;
+resuming many HITL triggers should pay that cost once per process.
+"""
+
+import functools
+
+from uipath import UiPath
+
+
+@functools.lru_cache(maxsize=1)
+def get_uipath_client() -> UiPath:
+    """Return a process-wide ``UiPath`` instance, created on first use.
+
+    Tests can reset the shared instance with
+    ``get_uipath_client.cache_clear()``.
+    """
+    return UiPath()
@@ -0,0 +1,416 @@
+import functools
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from uipath import UiPath
+from uipath.models.actions import Action
+
+from ._json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# Per-path instance cache with periodic mtime revalidation; projects without a
+# defaultEscalation section keep hitting the cached disabled instance instead
+# of re-statting and re-parsing uipath.json on every HITL event
+_ESCALATION_CACHE: Dict[str, "Escalation"] = {}
+_REVALIDATE_INTERVAL_SEC = 5.0
+
+# Opt-out of the amortized parse/validate: with UIPATH_REVALIDATE=1 every load
+# re-reads and re-validates the file even when its mtime is unchanged
+_FORCE_REVALIDATE = os.environ.get("UIPATH_REVALIDATE") == "1"
+
+# Interned config keys and prebuilt field collections, so repeated lookups
+# hash identity-matched strings and no per-load set/list is allocated
+_REQUEST = sys.intern("request")
+_RESPONSE = sys.intern("response")
+_TITLE = sys.intern("title")
+_APP_NAME = sys.intern("appName")
+_APP_KEY = sys.intern("appKey")
+_APP_VERSION = sys.intern("appVersion")
+_REQUIRED_FIELDS = (_REQUEST, _TITLE)
+_APP_KEYS = frozenset((_APP_NAME, _APP_KEY))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(
+    path_str: str, mtime_ns: int
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Read, parse and validate the escalation config, cached per (path, mtime).
+
+    The mtime key keeps the cache fresh when the file changes while letting
+    repeated `Escalation` instantiations on the HITL path skip the disk read
+    and JSON parse entirely.
+    """
+    config_data = _json_loads(Path(path_str).read_bytes())
+    escalation_config = config_data.get("defaultEscalation")
+
+    if not escalation_config:
+        return None, False
+
+    missing_fields = [
+        field for field in _REQUIRED_FIELDS if field not in escalation_config
+    ]
+
+    if not (escalation_config.keys() & _APP_KEYS):
+        missing_fields.append("appName or appKey")
+
+    if missing_fields:
+        raise ValueError(
+            f"Missing required fields in configuration: {', '.join(missing_fields)}"
+        )
+
+    logger.debug("Escalation configuration loaded successfully")
+    return escalation_config, True
+
+
+@functools.lru_cache(maxsize=256)
+def _split_value_path(path_expr: str) -> Tuple[str, ...]:
+    """Split a "$VALUE.a.b" expression into path parts, cached per template."""
+    return tuple(path_expr[len("$VALUE.") :].split("."))
+
+
+def _walk_value_path(parts: Tuple[str, ...], value: Any) -> Any:
+    """Follow pre-split path parts with a single indexed lookup per segment.
+
+    Templates are authored to match the payload, so the happy path dominates;
+    one try block around the loop replaces the per-segment isinstance and
+    containment checks, and missing or non-dict segments surface as the
+    caught exceptions.
+    """
+    current = value
+    try:
+        for part in parts:
+            current = current[part]
+    except (KeyError, TypeError, IndexError):
+        return None
+    return current
+
+
+def _compile_value_path(path_expr: str):
+    """Compile a "$VALUE.a.b" expression into a closure over pre-split parts."""
+    parts = _split_value_path(path_expr)
+
+    def extract(value: Any) -> Any:
+        return _walk_value_path(parts, value)
+
+    return extract
+
+
+_BOOL_MAP = {"true": True, "false": False, "True": True, "False": False}
+
+
+def _coerce_scalar(value: Any) -> Any:
+    """Coerce extracted string values to bool/int/float like the app payloads use.
+
+    Booleans resolve through a table lookup; numerics try ``int`` first (the
+    common case) and only fall back to ``float`` when a dot is present, so no
+    value pays two failed parses.
+    """
+    if isinstance(value, str):
+        flag = _BOOL_MAP.get(value)
+        if flag is None:
+            flag = _BOOL_MAP.get(value.casefold())
+        if flag is not None:
+            return flag
+        try:
+            return int(value)
+        except ValueError:
+            if "." in value:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+    return value
+
+
+def _compile_response_extractor(template_value: Any):
+    """Compile a response template value into an extractor, or None for literals."""
+    if template_value == "$VALUE":
+        return lambda value: value
+    if isinstance(template_value, str) and template_value.startswith("$VALUE."):
+        parts = _split_value_path(template_value)
+        return lambda value: _walk_value_path(parts, value)
+    return None
+
+
+def _codegen_template(template: Any):
+    """Generate a single flat builder function for a static request template.
+
+    The template's dict/list scaffolding is emitted as one Python expression
+    and ``exec``-compiled, so evaluation is a single call with no recursive
+    dispatch. Path expressions resolve through the shared walker via
+    pre-split parts captured in the function's globals.
+    """
+    consts: Dict[str, Any] = {}
+
+    def emit(node: Any) -> str:
+        if isinstance(node, dict):
+            items = ", ".join(f"{key!r}: {emit(child)}" for key, child in node.items())
+            return "{" + items + "}"
+        if isinstance(node, list):
+            return "[" + ", ".join(emit(child) for child in node) + "]"
+        if isinstance(node, str):
+            if node == "$VALUE":
+                return "v"
+            if node.startswith("$VALUE."):
+                name = f"_p{len(consts)}"
+                consts[name] = _split_value_path(node)
+                return f"_walk({name}, v)"
+        name = f"_c{len(consts)}"
+        consts[name] = node
+        return name
+
+    source = f"def _build(v):\n    return {emit(template)}\n"
+    namespace: Dict[str, Any] = {"_walk": _walk_value_path, **consts}
+    exec(compile(source, "<escalation-template>", "exec"), namespace)
+    return namespace["_build"]
+
+
+def _compile_template(template: Any):
+    """Compile a request template into a callable of the substituted value.
+
+    The template structure and its "$VALUE..." path expressions are parsed
+    once at config-load time; evaluating the returned callable only clones the
+    scaffolding and runs the precompiled leaf extractors.
+    """
+    if isinstance(template, dict):
+        compiled_items = [(key, _compile_template(v)) for key, v in template.items()]
+        return lambda value: {key: build(value) for key, build in compiled_items}
+    if isinstance(template, list):
+        compiled_entries = [_compile_template(item) for item in template]
+        return lambda value: [build(value) for build in compiled_entries]
+    if isinstance(template, str):
+        if template == "$VALUE":
+            return lambda value: value
+        if template.startswith("$VALUE."):
+            return _compile_value_path(template)
+    return lambda value, _literal=template: _literal
+
+
+class Escalation:
+    """Class to handle default escalation."""
+
+    def __init__(self, config_path: Union[str, Path] = "uipath.json"):
+        """Initialize the escalation with a config file path.
+
+        Args:
+            config_path: Path to the configuration file (string or Path object)
+        """
+        self.config_path = Path(config_path)
+        self._config = None
+        self._enabled = False
+        self._request_plan = None
+        self._response_plan = None
+        self._mtime_ns: Optional[int] = None
+        self._checked_at = time.monotonic()
+        self._load_config()
+
+    @classmethod
+    def get(cls, config_path: Union[str, Path] = "uipath.json") -> "Escalation":
+        """Return a cached instance for the given config path.
+
+        The cached instance — including the disabled one recorded when no
+        config exists — is reused as long as the file's mtime is unchanged;
+        the stat itself is only repeated every few seconds.
+        """
+        key = str(config_path)
+        cached = _ESCALATION_CACHE.get(key)
+        now = time.monotonic()
+        if cached is not None:
+            if now - cached._checked_at < _REVALIDATE_INTERVAL_SEC:
+                return cached
+            try:
+                mtime_ns: Optional[int] = os.stat(cached.config_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns == cached._mtime_ns:
+                cached._checked_at = now
+                return cached
+        instance = cls(config_path)
+        _ESCALATION_CACHE[key] = instance
+        return instance
+
+    @classmethod
+    def instance(cls) -> "Escalation":
+        """Return a process-wide default-config instance.
+
+        HITL readers and processors resolve the same config on every call, so
+        they share one instance instead of re-instantiating per event.
+        """
+        return cls.get()
+
+    def _load_config(self) -> None:
+        """Load and validate the default escalation from the config file.
+
+        If the 'defaultEscalation' section exists, validates required fields.
+        Raises error if required fields are missing.
+        """
+        try:
+            if _FORCE_REVALIDATE:
+                _load_config_cached.cache_clear()
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+            self._mtime_ns = mtime_ns
+            self._config, self._enabled = _load_config_cached(
+                str(self.config_path), mtime_ns
+            )
+            if self._enabled and self._config:
+                # Compile the request template once; prepare_data then only
+                # evaluates the prebuilt extractors instead of re-walking the
+                # template and re-parsing "$VALUE..." paths per call
+                request_template = self._config.get(_REQUEST, {})
+                try:
+                    self._request_plan = _codegen_template(request_template)
+                except Exception:
+                    self._request_plan = _compile_template(request_template)
+                response_template = self._config.get(_RESPONSE)
+                if response_template:
+                    self._response_plan = [
+                        (key, extractor)
+                        for key, extractor in (
+                            (key, _compile_response_extractor(template_value))
+                            for key, template_value in response_template.items()
+                        )
+                        if extractor is not None
+                    ]
+
+        except FileNotFoundError:
+            logger.debug(f"Config file not found: {self.config_path}")
+            self._enabled = False
+
+        except json.JSONDecodeError:
+            logger.warning(
+                f"Failed to parse config file {self.config_path}: Invalid JSON"
+            )
+            self._enabled = False
+
+        except ValueError as e:
+            logger.error(str(e))
+            raise
+
+        except Exception as e:
+            logger.error(f"Unexpected error loading config {self.config_path}: {e}")
+            self._enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        """Check if escalation is enabled.
+
+        Returns:
+            True if configuration is valid and loaded
+        """
+        return self._enabled
+
+    def prepare_data(self, value: Any) -> Dict[str, Any]:
+        """Prepare action data by replacing $VALUE placeholders with the provided value.
+
+        Args:
+            value: The value to substitute into the template
+
+        Returns:
+            Prepared data dictionary with substitutions applied
+        """
+        if not self.enabled or not self._config:
+            return {}
+
+        if isinstance(value, str):
+            try:
+                value_obj = _json_loads(value)
+            except json.JSONDecodeError:
+                value_obj = value
+        else:
+            value_obj = value
+
+        if self._request_plan is not None:
+            return self._request_plan(value_obj)
+
+        return self._substitute_values(self._config.get(_REQUEST, {}), value_obj)
+
+    def _substitute_values(
+        self, template: Dict[str, Any], value: Any
+    ) -> Dict[str, Any]:
+        """Replace template placeholders with actual values.
+
+        Args:
+            template: Template dictionary containing placeholders
+            value: Values to substitute into the template
+
+        Returns:
+            Template with values substituted
+        """
+
+        def process_value(template_value):
+            if isinstance(template_value, dict):
+                return {k: process_value(v) for k, v in template_value.items()}
+            elif isinstance(template_value, list):
+                return [process_value(item) for item in template_value]
+            elif isinstance(template_value, str):
+                if template_value == "$VALUE":
+                    return value
+                elif template_value.startswith("$VALUE."):
+                    return self._resolve_value_path(template_value, value)
+
+            return template_value
+
+        return process_value(template)
+
+    def _resolve_value_path(self, path_expr: str, value: Any) -> Any:
+        """Resolve a dot-notation path expression against a value.
+
+        Args:
+            path_expr: Path expression (e.g. "$VALUE.user.name")
+            value: Value object to extract data from
+
+        Returns:
+            Extracted value or None if path doesn't exist
+        """
+        return _walk_value_path(_split_value_path(path_expr), value)
+
+    def extract_response_value(self, action_data: Dict[str, Any]) -> Any:
+        if not self._config or self._response_plan is None:
+            return ""
+
+        for key, extractor in self._response_plan:
+            if key in action_data:
+                extracted_value = extractor(action_data[key])
+                if extracted_value is not None:
+                    return _coerce_scalar(extracted_value)
+
+        return action_data
+
+    async def create(self, value: Any) -> Optional[Action]:
+        """Create an escalation Action with the prepared data.
+
+        Args:
+            value: The dynamic value to be substituted into the template
+
+        Returns:
+            The created Action object or None if creation fails
+        """
+        if not self.enabled or not self._config:
+            return None
+
+        action_data = self.prepare_data(value)
+
+        if not action_data:
+            logger.warning("Action creation skipped: empty data after preparation")
+            return None
+
+        try:
+            uipath = UiPath()
+            action = uipath.actions.create(
+                title=self._config.get(_TITLE, "Default escalation"),
+                app_name=self._config.get(_APP_NAME),
+                app_key=self._config.get(_APP_KEY),
+                app_version=self._config.get(_APP_VERSION, 1),
+                data=action_data,
+            )
+            logger.info(f"Action created successfully: {action.key}")
+            return action
+        except Exception as e:
+            logger.error(f"Error creating action: {e}")
+            return None
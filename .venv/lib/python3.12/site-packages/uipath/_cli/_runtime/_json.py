@@ -0,0 +1,15 @@
+"""JSON parsing shim for the runtime hot paths.
+
+Prefers orjson's C-backed parser when it is installed; its
+``JSONDecodeError`` subclasses ``json.JSONDecodeError``, so callers keep
+catching the stdlib exception either way.
+"""
+
+import json
+
+try:
+    from orjson import loads
+except ImportError:
+    loads = json.loads
+
+__all__ = ["loads"]
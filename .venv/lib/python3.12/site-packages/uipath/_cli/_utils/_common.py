@@ -0,0 +1,177 @@
+import functools
+import os
+from typing import Optional
+
+import click
+
+from ..spinner import Spinner
+
+
+def environment_options(function):
+    function = click.option(
+        "--alpha",
+        "domain",
+        flag_value="alpha",
+        help="Use alpha environment",
+    )(function)
+    function = click.option(
+        "--staging",
+        "domain",
+        flag_value="staging",
+        help="Use staging environment",
+    )(function)
+    function = click.option(
+        "--cloud",
+        "domain",
+        flag_value="cloud",
+        default=True,
+        help="Use production environment",
+    )(function)
+    return function
+
+
+# Successful lookups are cached for the life of the process; repeated CLI
+# entry points then skip the environ reads entirely
+_env_cache: Optional[list[str | None]] = None
+
+
+def get_env_vars(spinner: Optional[Spinner] = None) -> list[str | None]:
+    global _env_cache
+    if _env_cache is not None:
+        return _env_cache
+
+    base_url = os.environ.get("UIPATH_URL")
+    token = os.environ.get("UIPATH_ACCESS_TOKEN")
+
+    if not base_url or not token:
+        if spinner:
+            spinner.stop()
+        click.echo(
+            "❌ Missing required environment variables. Please check your .env file contains:"
+        )
+        click.echo("UIPATH_URL, UIPATH_ACCESS_TOKEN")
+        click.get_current_context().exit(1)
+
+    _env_cache = [base_url, token]
+    return _env_cache
+
+
+def _clear_env_cache() -> None:
+    """Reset the cached env lookup (used by tests that mutate the env)."""
+    global _env_cache
+    _env_cache = None
+
+
+get_env_vars.cache_clear = _clear_env_cache  # type: ignore[attr-defined]
+
+
+# Exact-type set checked before any dispatch; covers the leaves that make up
+# the bulk of HITL payloads so they never enter the work stack
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _dump_model(obj):
+    return obj.model_dump(by_alias=True)
+
+
+def _dump_dict(obj):
+    return obj.dict()
+
+
+def _dump_to_dict(obj):
+    return obj.to_dict()
+
+
+@functools.lru_cache(maxsize=None)
+def _serializer_for_type(obj_type):
+    """Resolve the dump method once per concrete class.
+
+    Probing the class instead of each instance turns the per-object
+    ``hasattr`` chain into a single cached dict lookup.
+    """
+    if hasattr(obj_type, "model_dump"):
+        return _dump_model
+    if hasattr(obj_type, "dict"):
+        return _dump_dict
+    if hasattr(obj_type, "to_dict"):
+        return _dump_to_dict
+    return None
+
+
+def _convert(obj):
+    """Turn a model-like or mapping-like object into a walkable container.
+
+    Returns the object unchanged when no conversion applies, which the walker
+    treats as a leaf.
+    """
+    serializer = _serializer_for_type(type(obj))
+    if serializer is not None:
+        return serializer(obj)
+    # Dict/list subclasses re-enter the walker as plain containers
+    if isinstance(obj, dict):
+        return dict(obj)
+    if isinstance(obj, (list, tuple)):
+        return list(obj)
+    # Handle other iterable objects (convert to dict first)
+    if hasattr(obj, "__iter__"):
+        try:
+            return dict(obj)
+        except (TypeError, ValueError):
+            return obj
+    return obj
+
+
+def _is_plain_json(values) -> bool:
+    """Single shallow pass checking that every value is a primitive leaf."""
+    for v in values:
+        if type(v) not in _PRIMITIVE_TYPES:
+            return False
+    return True
+
+
+def serialize_object(obj):
+    """Serializes an object and all its nested components.
+
+    Primitives and flat dicts/lists of primitives — the common HITL payload
+    shapes — return after a shallow check. Everything else is walked
+    iteratively with an explicit work stack and exact-type dispatch, so deeply
+    nested payloads don't pay a Python frame plus chained ``hasattr`` probes
+    for every node.
+    """
+    obj_type = type(obj)
+    if obj is None or obj_type in _PRIMITIVE_TYPES:
+        return obj
+    if obj_type is dict and _is_plain_json(obj.values()):
+        return obj.copy()
+    if obj_type is list and _is_plain_json(obj):
+        return obj.copy()
+    root: list = [None]
+    stack: list = [(obj, root, 0)]
+    while stack:
+        node, out, key = stack.pop()
+        node_type = type(node)
+        if node_type in _PRIMITIVE_TYPES:
+            out[key] = node
+        elif node_type is dict:
+            target: dict = {}
+            out[key] = target
+            for k, v in node.items():
+                if type(v) in _PRIMITIVE_TYPES:
+                    target[k] = v
+                else:
+                    stack.append((v, target, k))
+        elif node_type is list or node_type is tuple:
+            items: list = [None] * len(node)
+            out[key] = items
+            for i, v in enumerate(node):
+                if type(v) in _PRIMITIVE_TYPES:
+                    items[i] = v
+                else:
+                    stack.append((v, items, i))
+        else:
+            converted = _convert(node)
+            if converted is node:
+                out[key] = node
+            else:
+                stack.append((converted, out, key))
+    return root[0]
@@ -0,0 +1,214 @@
+import datetime
+import json
+import logging
+import re
+import sys
+from typing import Iterable, Union
+from zoneinfo import ZoneInfo
+
+# httpx passes the method as the same interned constant per call site, so the
+# identity check usually resolves the compare without touching characters
+_POST = sys.intern("POST")
+
+
+class IgnoreSpecificUrl(logging.Filter):
+    def __init__(self, url_to_ignore):
+        super().__init__()
+        self.url_to_ignore = url_to_ignore
+        self._tail = sys.intern(url_to_ignore)
+        self._tail_len = len(url_to_ignore)
+        self._fmt = 'HTTP Request: %s %s "%s %d %s"'
+
+    def filter(self, record):
+        # httpx request records are INFO; anything below can't match the
+        # format string, so skip the string compare entirely
+        if record.levelno < logging.INFO:
+            return False
+        msg = record.msg
+        if msg is not self._fmt:
+            if msg != self._fmt:
+                return False
+            # httpx passes the same literal object on every request record;
+            # remember it so subsequent compares are a pointer check instead
+            # of a character-by-character string compare
+            self._fmt = msg
+
+        args = record.args
+        if type(args) is not tuple or len(args) < 2:
+            return False
+
+        method = args[0]
+        url = args[1]
+        try:
+            if (method is _POST or method == _POST) and url.path[
+                -self._tail_len :
+            ] == self._tail:
+                # Check if the URL contains the specific path we want to ignore
+                return True
+        except Exception:
+            return False
+        return False
+
+
+class IgnoreUrls(logging.Filter):
+    """Single filter matching any of several ignored endpoint suffixes.
+
+    One compiled alternation scans the path once for all patterns, instead of
+    stacking one ``IgnoreSpecificUrl`` per endpoint and running each filter's
+    ``endswith`` serially per record.
+    """
+
+    def __init__(self, urls: Iterable[str]):
+        super().__init__()
+        self._suffix_re = re.compile(
+            "(" + "|".join(map(re.escape, urls)) + ")$"
+        )
+        self._fmt = 'HTTP Request: %s %s "%s %d %s"'
+
+    def filter(self, record):
+        if record.levelno < logging.INFO:
+            return False
+        msg = record.msg
+        if msg is not self._fmt:
+            if msg != self._fmt:
+                return False
+            self._fmt = msg
+
+        args = record.args
+        if type(args) is not tuple or len(args) < 2:
+            return False
+
+        method = args[0]
+        url = args[1]
+        try:
+            if (
+                method is _POST or method == _POST
+            ) and self._suffix_re.search(url.path) is not None:
+                return True
+        except Exception:
+            return False
+        return False
+
+
+def setup_tracer_httpx_logging(url: Union[str, Iterable[str]]):
+    # Prefer handler-level attachment: handler filters only run for records
+    # that already passed the level check. When httpx has no handlers of its
+    # own (records propagate to root), fall back to the logger itself so the
+    # filter still sees every request record.
+    urls = [url] if isinstance(url, str) else list(url)
+    httpx_logger = logging.getLogger("httpx")
+    url_filter = IgnoreUrls(urls) if len(urls) > 1 else IgnoreSpecificUrl(urls[0])
+    if httpx_logger.handlers:
+        for handler in httpx_logger.handlers:
+            handler.addFilter(url_filter)
+    else:
+        httpx_logger.addFilter(url_filter)
+
+
+def _serialize_model(obj):
+    return obj.model_dump(exclude_none=True, mode="json")
+
+
+def _serialize_dict_method(obj):
+    return obj.dict()
+
+
+def _serialize_to_dict(obj):
+    return obj.to_dict()
+
+
+def _serialize_asdict(obj):
+    return obj._asdict()
+
+
+def _serialize_list(obj):
+    return list(obj)
+
+
+def _serialize_isoformat(obj):
+    return obj.isoformat()
+
+
+def _serialize_tzname(obj):
+    return obj.tzname(None)
+
+
+def _serialize_str(obj):
+    return str(obj)
+
+
+# Common concrete types resolve with one dict probe; everything else is
+# detected once per class in _resolve_serializer and installed here
+_DISPATCH = {
+    datetime.datetime: _serialize_isoformat,
+    datetime.timezone: _serialize_tzname,
+    ZoneInfo: _serialize_tzname,
+    set: _serialize_list,
+    frozenset: _serialize_list,
+    tuple: _serialize_list,
+}
+
+
+def _resolve_serializer(obj_type):
+    """Detect the serialization capability once for a newly seen class."""
+    if hasattr(obj_type, "model_dump"):
+        return _serialize_model
+    if hasattr(obj_type, "dict"):
+        return _serialize_dict_method
+    if hasattr(obj_type, "to_dict"):
+        return _serialize_to_dict
+    if issubclass(obj_type, (set, tuple)):
+        if callable(getattr(obj_type, "_asdict", None)):
+            return _serialize_asdict
+        return _serialize_list
+    if issubclass(obj_type, datetime.datetime):
+        return _serialize_isoformat
+    if issubclass(obj_type, (datetime.timezone, ZoneInfo)):
+        return _serialize_tzname
+    return _serialize_str
+
+
+def simple_serialize_defaults(obj):
+    obj_type = type(obj)
+    handler = _DISPATCH.get(obj_type)
+    if handler is None:
+        handler = _resolve_serializer(obj_type)
+        _DISPATCH[obj_type] = handler
+    return handler(obj)
+
+
+# One reusable encoder: json.dumps(..., default=...) rebuilds the encoder and
+# re-parses its kwargs per call, while a bound encode skips straight to the
+# C-accelerated serializer. ensure_ascii=False also avoids the escape loop
+# for non-ASCII payloads.
+_TRACE_ENCODER = json.JSONEncoder(
+    default=simple_serialize_defaults, separators=(",", ":"), ensure_ascii=False
+)
+encode_trace = _TRACE_ENCODER.encode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # PASSTHROUGH_DATETIME routes datetimes through our default instead of
+    # orjson's own formatter, so the dispatch table keeps producing the same
+    # isoformat strings the stdlib path emits
+    _ORJSON_OPTS = orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps_trace(obj) -> str:
+        """Serialize a trace payload to compact JSON.
+
+        Uses orjson when available, falling back to the shared stdlib
+        encoder. Both paths share ``simple_serialize_defaults`` so custom
+        types serialize identically regardless of backend.
+        """
+        return orjson.dumps(
+            obj, default=simple_serialize_defaults, option=_ORJSON_OPTS
+        ).decode()
+else:
+
+    def dumps_trace(obj) -> str:
+        """Serialize a trace payload to compact JSON via the stdlib encoder."""
+        return encode_trace(obj)
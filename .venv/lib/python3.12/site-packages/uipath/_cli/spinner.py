@@ -0,0 +1,53 @@
+import sys
+from typing import TYPE_CHECKING, Optional
+
+from rich.console import Console
+from rich.spinner import Spinner as RichSpinner
+from rich.text import Text
+
+if TYPE_CHECKING:
+    from rich.live import Live
+
+
+class Spinner:
+    """A simple spinner class for terminal output using Rich with pinned spinner."""
+
+    def __init__(self, message: str = ""):
+        self.message = message
+        self._console = Console()
+        self._live: Optional["Live"] = None
+        self._spinner = RichSpinner("dots", Text(message))
+
+    def start(self, message: str = "") -> None:
+        """Start the spinner animation.
+
+        Args:
+            message: Optional new message to display.
+        """
+        if message:
+            self.message = message
+            self._spinner.text = Text(message)
+
+        # Non-interactive output (CI logs, pipes) gets one static line; an
+        # animated Live would only burn CPU re-rendering into a buffer
+        if not sys.stdout.isatty():
+            if self.message:
+                self._console.print(self.message)
+            return
+
+        # Deferred: rich.live is only needed once a spinner actually starts
+        from rich.live import Live
+
+        self._live = Live(
+            self._spinner,
+            console=self._console,
+            refresh_per_second=5,
+            transient=True,
+            auto_refresh=True,
+        )
+        self._live.start()
+
+    def stop(self) -> None:
+        """Stop the spinner animation and clean up."""
+        if self._live:
+            self._live.stop()
@@ -0,0 +1,922 @@
+import asyncio
+import functools
+import mimetypes
+import os
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from httpx import HTTPStatusError
+from pydantic import TypeAdapter
+
+from .._config import Config
+from .._execution_context import ExecutionContext
+from .._folder_context import FolderContext
+from .._utils import Endpoint, RequestSpec, header_folder, infer_bindings
+from .._utils._ssl_context import (
+    get_shared_async_httpx_client,
+    get_shared_httpx_client,
+)
+from ..models import Bucket
+from ..models.exceptions import EnrichedException
+from ..tracing._traced import traced
+from ._base_service import BaseService
+
+# Validator resolved once at import; model_validate re-walks the class
+# attributes to find __pydantic_validator__ on every call
+_BUCKET_ADAPTER = TypeAdapter(Bucket)
+
+_TRANSFER_CHUNK_SIZE = 1 << 16
+_BUCKET_ID_CACHE_MAX = 256
+
+def _folder_headers(
+    folder_key: Optional[str], folder_path: Optional[str]
+) -> Dict[str, str]:
+    # Always a fresh dict, never a shared constant: BaseService.request
+    # injects the user-agent into the headers dict it receives, so sharing
+    # would leak that mutation across requests
+    if folder_key is None and folder_path is None:
+        return {}
+    return header_folder(folder_key, folder_path)
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_uri_endpoint(bucket_id: int) -> Endpoint:
+    return Endpoint(
+        f"/orchestrator_/odata/Buckets({bucket_id})/UiPath.Server.Configuration.OData.GetReadUri"
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _write_uri_endpoint(bucket_id: int) -> Endpoint:
+    return Endpoint(
+        f"/orchestrator_/odata/Buckets({bucket_id})/UiPath.Server.Configuration.OData.GetWriteUri"
+    )
+
+# Extension lookup resolved once at import: guess_type() takes the mimetypes
+# init lock and URL-parses its argument on every call; types_map entries win
+# over the legacy common_types, matching guess_type's strict-first order
+_EXT_MIME = {**mimetypes.common_types, **mimetypes.types_map}
+
+# Fallback lifetime for cached presigned URIs whose expiry cannot be read
+# from the SAS token; kept safely below typical SAS validity windows
+_URI_DEFAULT_TTL_SEC = 240.0
+# Refresh margin so a URI is never handed out moments before it lapses
+_URI_EXPIRY_SLACK_SEC = 30.0
+
+
+def _presigned_uri_expiry(uri: str) -> float:
+    """Best-effort expiry epoch for a presigned URI.
+
+    Azure SAS tokens carry their expiry in the ``se`` query parameter; when
+    present it bounds the cache entry exactly, otherwise a conservative
+    default TTL applies.
+    """
+    try:
+        for param, value in parse_qsl(urlsplit(uri).query):
+            if param == "se":
+                expiry = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return expiry.timestamp() - _URI_EXPIRY_SLACK_SEC
+    except (ValueError, TypeError):
+        pass
+    return time.time() + _URI_DEFAULT_TTL_SEC
+
+
+# Async uploads read in 1 MiB blocks: every block costs an executor round
+# trip (submit, context switch, wake the loop), so larger reads cut that
+# overhead 16x versus the 64 KiB wire chunk size while staying small enough
+# not to stall the sender
+_ASYNC_READ_BLOCK = 1 << 20
+
+
+class _FileByteStream:
+    """Replayable streaming request body over a seekable file.
+
+    Rewinds to the start of the file on every iteration, so when a tenacity
+    retry in ``BaseService.request`` re-sends the PUT, the new attempt
+    replays the whole body. Handing httpx the raw file would resume from
+    wherever the failed attempt left off, truncating the resend against the
+    precomputed Content-Length.
+    """
+
+    __slots__ = ("_file",)
+
+    def __init__(self, file):
+        self._file = file
+
+    def __iter__(self):
+        self._file.seek(0)
+        while True:
+            chunk = self._file.read(_TRANSFER_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+class _AsyncFileByteStream:
+    """Async counterpart of :class:`_FileByteStream`.
+
+    Reads go through a worker thread so large blobs never block the event
+    loop. Kept as a separate class without ``__iter__``: httpx dispatches on
+    ``Iterable`` before ``AsyncIterable``, so a body implementing both
+    protocols would be routed through the sync stream even on the async
+    client.
+    """
+
+    __slots__ = ("_file",)
+
+    def __init__(self, file):
+        self._file = file
+
+    async def __aiter__(self):
+        await asyncio.to_thread(self._file.seek, 0)
+        while True:
+            chunk = await asyncio.to_thread(self._file.read, _ASYNC_READ_BLOCK)
+            if not chunk:
+                return
+            yield chunk
+
+
+def _write_all(file, chunk) -> None:
+    """Write a chunk fully to a raw (unbuffered) file.
+
+    Raw writes may be partial, so loop over a memoryview slice instead of
+    re-copying the remainder into new bytes objects.
+    """
+    view = memoryview(chunk)
+    while view:
+        written = file.write(view)
+        view = view[written:]
+
+
+def _prefetch_file(path):
+    """Hint the kernel to pull the file into the page cache.
+
+    POSIX_FADV_WILLNEED kicks off asynchronous readahead and returns
+    immediately, so by the time the upload starts streaming the first chunks
+    are already resident. Best effort: unsupported platforms are a no-op.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+class BucketsService(FolderContext, BaseService):
+    """Service for managing UiPath storage buckets.
+
+    Buckets are cloud storage containers that can be used to store and manage files
+    used by automation processes.
+    """
+
+    def __init__(self, config: Config, execution_context: ExecutionContext) -> None:
+        super().__init__(config=config, execution_context=execution_context)
+        # Unauthenticated blob transfers (presigned SAS URIs) share the
+        # process-wide pools, so repeated service construction doesn't open
+        # fresh connection pools or redo TLS handshakes
+        self.custom_client = get_shared_httpx_client()
+        self.custom_client_async = get_shared_async_httpx_client()
+        # (name, key, folder) -> bucket id, so loops transferring to the same
+        # bucket resolve metadata once instead of once per call
+        self._bucket_id_cache: Dict[tuple, int] = {}
+        # (bucket id, blob path, content type, folder) -> (GetReadUri /
+        # GetWriteUri response, expiry epoch); repeated access to the same
+        # blob reuses the presigned URI instead of another orchestrator GET
+        self._uri_cache: Dict[tuple, tuple[dict, float]] = {}
+
+    @traced(name="buckets_download", run_type="uipath")
+    @infer_bindings(resource_type="bucket")
+    def download(
+        self,
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        blob_file_path: str,
+        destination_path: str,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        bucket_id: Optional[int] = None,
+        bucket: Optional[Bucket] = None,
+    ) -> None:
+        """Download a file from a bucket.
+
+        Args:
+            key (Optional[str]): The key of the bucket.
+            name (Optional[str]): The name of the bucket.
+            blob_file_path (str): The path to the file in the bucket.
+            destination_path (str): The local path where the file will be saved.
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+            bucket_id (Optional[int]): The id of the bucket, if already known; skips the metadata lookup.
+            bucket (Optional[Bucket]): A previously retrieved bucket; its id is used directly.
+
+        Raises:
+            ValueError: If neither key nor name is provided.
+            Exception: If the bucket with the specified key is not found.
+        """
+        if bucket_id is None and bucket is not None:
+            bucket_id = bucket.id
+        if bucket_id is None:
+            bucket_id = self._resolve_bucket_id(
+                name=name, key=key, folder_key=folder_key, folder_path=folder_path
+            )
+        cache_key = (bucket_id, blob_file_path, None, folder_key, folder_path)
+
+        def fetch() -> dict:
+            spec = self._retrieve_readUri_spec(
+                bucket_id,
+                blob_file_path,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+            result = self.json_fast(
+                self.request(
+                    spec.method,
+                    url=spec.endpoint,
+                    params=spec.params,
+                    headers=spec.headers,
+                )
+            )
+            self._store_uri_result(cache_key, result)
+            return result
+
+        def transfer(result: dict) -> None:
+            read_uri = result["Uri"]
+
+            # dict(zip(...)) builds the mapping in C, skipping the per-item
+            # interpreter loop; truncation on unequal lengths matches the old
+            # strict=False behavior
+            headers = dict(zip(result["Headers"]["Keys"], result["Headers"]["Values"]))
+
+            # buffering=0 skips the BufferedWriter copy: each streamed chunk
+            # goes straight from the response to the write syscall
+            with open(destination_path, "wb", buffering=0) as file:
+                # the self.stream client adds auth bearer token; streamed
+                # chunks keep peak memory at one chunk and overlap disk
+                # writes with the network receive
+                if result["RequiresAuth"]:
+                    stream_ctx = self.stream("GET", read_uri, headers=headers)
+                else:
+                    stream_ctx = self.custom_client.stream(
+                        "GET", read_uri, headers=headers
+                    )
+                with stream_ctx as response:
+                    # fail before touching the destination file: an expired
+                    # presigned URI answers 403 with an error document that
+                    # must not end up on disk as the blob
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(_TRANSFER_CHUNK_SIZE):
+                        _write_all(file, chunk)
+
+        self._transfer_with_uri_retry(cache_key, fetch, transfer)
+
+    @traced(name="buckets_download", run_type="uipath")
+    @infer_bindings(resource_type="bucket")
+    async def download_async(
+        self,
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        blob_file_path: str,
+        destination_path: str,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        bucket_id: Optional[int] = None,
+        bucket: Optional[Bucket] = None,
+    ) -> None:
+        """Download a file from a bucket asynchronously.
+
+        Args:
+            key (Optional[str]): The key of the bucket.
+            name (Optional[str]): The name of the bucket.
+            blob_file_path (str): The path to the file in the bucket.
+            destination_path (str): The local path where the file will be saved.
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+            bucket_id (Optional[int]): The id of the bucket, if already known; skips the metadata lookup.
+            bucket (Optional[Bucket]): A previously retrieved bucket; its id is used directly.
+
+        Raises:
+            ValueError: If neither key nor name is provided.
+            Exception: If the bucket with the specified key is not found.
+        """
+        if bucket_id is None and bucket is not None:
+            bucket_id = bucket.id
+        if bucket_id is None:
+            bucket_id = await self._resolve_bucket_id_async(
+                name=name, key=key, folder_key=folder_key, folder_path=folder_path
+            )
+        cache_key = (bucket_id, blob_file_path, None, folder_key, folder_path)
+
+        async def fetch() -> dict:
+            spec = self._retrieve_readUri_spec(
+                bucket_id,
+                blob_file_path,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+            result = self.json_fast(
+                await self.request_async(
+                    spec.method,
+                    url=spec.endpoint,
+                    params=spec.params,
+                    headers=spec.headers,
+                )
+            )
+            self._store_uri_result(cache_key, result)
+            return result
+
+        async def transfer(result: dict) -> None:
+            read_uri = result["Uri"]
+
+            # dict(zip(...)) builds the mapping in C, skipping the per-item
+            # interpreter loop; truncation on unequal lengths matches the old
+            # strict=False behavior
+            headers = dict(zip(result["Headers"]["Keys"], result["Headers"]["Values"]))
+
+            with open(destination_path, "wb", buffering=0) as file:
+                # the self.stream_async client adds auth bearer token
+                if result["RequiresAuth"]:
+                    stream_ctx = self.stream_async("GET", read_uri, headers=headers)
+                else:
+                    stream_ctx = self.custom_client_async.stream(
+                        "GET", read_uri, headers=headers
+                    )
+                async with stream_ctx as response:
+                    # fail before touching the destination file: an expired
+                    # presigned URI answers 403 with an error document that
+                    # must not end up on disk as the blob
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(_TRANSFER_CHUNK_SIZE):
+                        _write_all(file, chunk)
+
+        await self._transfer_with_uri_retry_async(cache_key, fetch, transfer)
+
+    @traced(name="buckets_upload", run_type="uipath")
+    @infer_bindings(resource_type="bucket")
+    def upload(
+        self,
+        *,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+        blob_file_path: str,
+        content_type: Optional[str] = None,
+        source_path: Optional[str] = None,
+        content: Optional[Union[str, bytes]] = None,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        bucket_id: Optional[int] = None,
+        bucket: Optional[Bucket] = None,
+    ) -> None:
+        """Upload a file to a bucket.
+
+        Args:
+            key (Optional[str]): The key of the bucket.
+            name (Optional[str]): The name of the bucket.
+            blob_file_path (str): The path where the file will be stored in the bucket.
+            content_type (Optional[str]): The MIME type of the file. For file inputs this is computed dynamically. Default is "application/octet-stream".
+            source_path (Optional[str]): The local path of the file to upload.
+            content (Optional[Union[str, bytes]]): The content to upload (string or bytes).
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+            bucket_id (Optional[int]): The id of the bucket, if already known; skips the metadata lookup.
+            bucket (Optional[Bucket]): A previously retrieved bucket; its id is used directly.
+
+        Raises:
+            ValueError: If neither key nor name is provided.
+            Exception: If the bucket with the specified key or name is not found.
+        """
+        if content is not None and source_path is not None:
+            raise ValueError("Content and source_path are mutually exclusive")
+        if content is None and source_path is None:
+            raise ValueError("Either content or source_path must be provided")
+
+        if bucket_id is None and bucket is not None:
+            bucket_id = bucket.id
+        if bucket_id is None:
+            bucket_id = self._resolve_bucket_id(
+                name=name, key=key, folder_key=folder_key, folder_path=folder_path
+            )
+
+        # if source_path, dynamically detect the mime type
+        # default to application/octet-stream
+        if source_path:
+            _content_type = _EXT_MIME.get(os.path.splitext(source_path)[1].lower())
+        else:
+            _content_type = content_type
+        _content_type = _content_type or "application/octet-stream"
+
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        cache_key = (bucket_id, blob_file_path, _content_type, folder_key, folder_path)
+
+        def fetch() -> dict:
+            spec = self._retrieve_writeri_spec(
+                bucket_id,
+                _content_type,
+                blob_file_path,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+            result = self.json_fast(
+                self.request(
+                    spec.method,
+                    url=spec.endpoint,
+                    params=spec.params,
+                    headers=spec.headers,
+                )
+            )
+            self._store_uri_result(cache_key, result)
+            return result
+
+        def transfer(result: dict) -> None:
+            write_uri = result["Uri"]
+
+            # dict(zip(...)) builds the mapping in C, skipping the per-item
+            # interpreter loop; truncation on unequal lengths matches the old
+            # strict=False behavior
+            headers = dict(zip(result["Headers"]["Keys"], result["Headers"]["Values"]))
+
+            headers["Content-Type"] = _content_type
+
+            if content is not None:
+                if result["RequiresAuth"]:
+                    self.request("PUT", write_uri, headers=headers, content=content)
+                else:
+                    self.custom_client.put(
+                        write_uri, headers=headers, content=content
+                    ).raise_for_status()
+                return
+
+            # Stream the body in chunks instead of materializing the whole
+            # blob in memory; an explicit Content-Length avoids chunked
+            # transfer encoding
+            # buffering=0: httpx reads 64 KiB chunks anyway, so the extra
+            # BufferedReader copy between the kernel and the socket is waste
+            with open(source_path, "rb", buffering=0) as file:
+                # fstat on the open descriptor sizes exactly the file being
+                # sent, with no stat-then-open race on a changing path
+                headers["Content-Length"] = str(os.fstat(file.fileno()).st_size)
+                body = _FileByteStream(file)
+                if result["RequiresAuth"]:
+                    self.request("PUT", write_uri, headers=headers, content=body)
+                else:
+                    self.custom_client.put(
+                        write_uri, headers=headers, content=body
+                    ).raise_for_status()
+
+        self._transfer_with_uri_retry(cache_key, fetch, transfer)
+
+    @traced(name="buckets_upload", run_type="uipath")
+    @infer_bindings(resource_type="bucket")
+    async def upload_async(
+        self,
+        *,
+        key: Optional[str] = None,
+        name: Optional[str] = None,
+        blob_file_path: str,
+        content_type: Optional[str] = None,
+        source_path: Optional[str] = None,
+        content: Optional[Union[str, bytes]] = None,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+        bucket_id: Optional[int] = None,
+        bucket: Optional[Bucket] = None,
+    ) -> None:
+        """Upload a file to a bucket asynchronously.
+
+        Args:
+            key (Optional[str]): The key of the bucket.
+            name (Optional[str]): The name of the bucket.
+            blob_file_path (str): The path where the file will be stored in the bucket.
+            content_type (Optional[str]): The MIME type of the file. For file inputs this is computed dynamically. Default is "application/octet-stream".
+            source_path (str): The local path of the file to upload.
+            content (Optional[Union[str, bytes]]): The content to upload (string or bytes).
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+            bucket_id (Optional[int]): The id of the bucket, if already known; skips the metadata lookup.
+            bucket (Optional[Bucket]): A previously retrieved bucket; its id is used directly.
+
+        Raises:
+            ValueError: If neither key nor name is provided.
+            Exception: If the bucket with the specified key or name is not found.
+        """
+        if content is not None and source_path is not None:
+            raise ValueError("Content and source_path are mutually exclusive")
+        if content is None and source_path is None:
+            raise ValueError("Either content or source_path must be provided")
+
+        read_ahead = None
+        if source_path is not None:
+            # Warm the page cache in a worker thread while the bucket-id and
+            # write-URI roundtrips are in flight, hiding disk latency behind
+            # the network RTTs
+            read_ahead = asyncio.create_task(
+                asyncio.to_thread(_prefetch_file, source_path)
+            )
+
+        if bucket_id is None and bucket is not None:
+            bucket_id = bucket.id
+        if bucket_id is None:
+            bucket_id = await self._resolve_bucket_id_async(
+                name=name, key=key, folder_key=folder_key, folder_path=folder_path
+            )
+
+        # if source_path, dynamically detect the mime type
+        # default to application/octet-stream
+        if source_path:
+            _content_type = _EXT_MIME.get(os.path.splitext(source_path)[1].lower())
+        else:
+            _content_type = content_type
+        _content_type = _content_type or "application/octet-stream"
+
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        cache_key = (bucket_id, blob_file_path, _content_type, folder_key, folder_path)
+
+        async def fetch() -> dict:
+            spec = self._retrieve_writeri_spec(
+                bucket_id,
+                _content_type,
+                blob_file_path,
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+            result = self.json_fast(
+                await self.request_async(
+                    spec.method,
+                    url=spec.endpoint,
+                    params=spec.params,
+                    headers=spec.headers,
+                )
+            )
+            self._store_uri_result(cache_key, result)
+            return result
+
+        async def transfer(result: dict) -> None:
+            write_uri = result["Uri"]
+
+            # dict(zip(...)) builds the mapping in C, skipping the per-item
+            # interpreter loop; truncation on unequal lengths matches the old
+            # strict=False behavior
+            headers = dict(zip(result["Headers"]["Keys"], result["Headers"]["Values"]))
+
+            headers["Content-Type"] = _content_type
+
+            if content is not None:
+                if result["RequiresAuth"]:
+                    await self.request_async(
+                        "PUT", write_uri, headers=headers, content=content
+                    )
+                else:
+                    (
+                        await self.custom_client_async.put(
+                            write_uri, headers=headers, content=content
+                        )
+                    ).raise_for_status()
+                return
+
+            # re-awaiting an already finished task is free, so a URI-refresh
+            # retry doesn't re-run the prefetch
+            await read_ahead
+            # Stream the file through a worker thread so large blobs neither
+            # sit fully in memory nor block the event loop during reads
+            with open(source_path, "rb", buffering=0) as file:
+                headers["Content-Length"] = str(os.fstat(file.fileno()).st_size)
+                body = _AsyncFileByteStream(file)
+                if result["RequiresAuth"]:
+                    await self.request_async(
+                        "PUT", write_uri, headers=headers, content=body
+                    )
+                else:
+                    (
+                        await self.custom_client_async.put(
+                            write_uri, headers=headers, content=body
+                        )
+                    ).raise_for_status()
+
+        await self._transfer_with_uri_retry_async(cache_key, fetch, transfer)
+
+    @traced(name="buckets_upload_many", run_type="uipath")
+    async def upload_many(
+        self, items: Iterable[Dict[str, Any]], *, concurrency: int = 16
+    ) -> None:
+        """Upload multiple files concurrently.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Keyword-argument dicts, one per
+                `upload_async` call.
+            concurrency (int): Maximum number of uploads in flight at once.
+        """
+        items = list(items)
+        await self._warm_bucket_ids(items)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(item: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self.upload_async(**item)
+
+        await asyncio.gather(*(_one(item) for item in items))
+
+    @traced(name="buckets_download_many", run_type="uipath")
+    async def download_many(
+        self, items: Iterable[Dict[str, Any]], *, concurrency: int = 16
+    ) -> None:
+        """Download multiple files concurrently.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Keyword-argument dicts, one per
+                `download_async` call.
+            concurrency (int): Maximum number of downloads in flight at once.
+        """
+        items = list(items)
+        await self._warm_bucket_ids(items)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(item: Dict[str, Any]) -> None:
+            async with semaphore:
+                await self.download_async(**item)
+
+        await asyncio.gather(*(_one(item) for item in items))
+
+    async def _warm_bucket_ids(self, items: Iterable[Dict[str, Any]]) -> None:
+        # Resolve each distinct bucket once before the fanout so concurrent
+        # transfers don't race to issue the same metadata lookup
+        for item in items:
+            if item.get("bucket_id") is not None:
+                continue
+            cache_key = (
+                item.get("name"),
+                item.get("key"),
+                item.get("folder_key"),
+                item.get("folder_path"),
+            )
+            if cache_key not in self._bucket_id_cache:
+                await self._resolve_bucket_id_async(
+                    name=cache_key[0],
+                    key=cache_key[1],
+                    folder_key=cache_key[2],
+                    folder_path=cache_key[3],
+                )
+
+    @traced(name="buckets_retrieve", run_type="uipath")
+    @infer_bindings(resource_type="bucket")
+    def retrieve(
+        self,
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> Bucket:
+        """Retrieve bucket information by its name.
+
+        Args:
+            name (Optional[str]): The name of the bucket to retrieve.
+            key (Optional[str]): The key of the bucket.
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+
+        Returns:
+            Response: The bucket details.
+
+        Raises:
+            ValueError: If neither bucket key nor bucket name is provided.
+            Exception: If the bucket with the specified name is not found.
+        """
+        if not (key or name):
+            raise ValueError("Must specify a bucket name or bucket key")
+        if key:
+            spec = self._retrieve_by_key_spec(
+                key, folder_key=folder_key, folder_path=folder_path
+            )
+        else:
+            spec = self._retrieve_spec(
+                name,  # type: ignore
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+        try:
+            response = self.request(
+                spec.method,
+                url=spec.endpoint,
+                params=spec.params,
+                headers=spec.headers,
+            ).json()["value"][0]
+        except (KeyError, IndexError) as e:
+            raise Exception(f"Bucket with name '{name}' not found") from e
+        return _BUCKET_ADAPTER.validate_python(response)
+
+    @traced(name="buckets_retrieve", run_type="uipath")
+    @infer_bindings(resource_type="bucket")
+    async def retrieve_async(
+        self,
+        *,
+        name: Optional[str] = None,
+        key: Optional[str] = None,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> Bucket:
+        """Asynchronously retrieve bucket information by its name.
+
+        Args:
+            name (Optional[str]): The name of the bucket to retrieve.
+            key (Optional[str]): The key of the bucket.
+            folder_key (Optional[str]): The key of the folder where the bucket resides.
+            folder_path (Optional[str]): The path of the folder where the bucket resides.
+
+        Returns:
+            Response: The bucket details.
+
+        Raises:
+            ValueError: If neither bucket key nor bucket name is provided.
+            Exception: If the bucket with the specified name is not found.
+        """
+        if not (key or name):
+            raise ValueError("Must specify a bucket name or bucket key")
+        if key:
+            spec = self._retrieve_by_key_spec(
+                key, folder_key=folder_key, folder_path=folder_path
+            )
+        else:
+            spec = self._retrieve_spec(
+                name,  # type: ignore
+                folder_key=folder_key,
+                folder_path=folder_path,
+            )
+
+        try:
+            response = (
+                await self.request_async(
+                    spec.method,
+                    url=spec.endpoint,
+                    params=spec.params,
+                    headers=spec.headers,
+                )
+            ).json()["value"][0]
+        except (KeyError, IndexError) as e:
+            raise Exception(f"Bucket with name '{name}' not found") from e
+        return _BUCKET_ADAPTER.validate_python(response)
+
+    def _cached_uri_result(self, cache_key: tuple) -> Optional[dict]:
+        entry = self._uri_cache.get(cache_key)
+        if entry is None:
+            return None
+        result, expires_at = entry
+        if time.time() >= expires_at:
+            del self._uri_cache[cache_key]
+            return None
+        return result
+
+    def _store_uri_result(self, cache_key: tuple, result: dict) -> None:
+        self._uri_cache[cache_key] = (result, _presigned_uri_expiry(result["Uri"]))
+
+    def _transfer_with_uri_retry(
+        self,
+        cache_key: tuple,
+        fetch: Callable[[], dict],
+        transfer: Callable[[dict], None],
+    ) -> None:
+        """Run a blob transfer, reusing and policing the presigned-URI cache.
+
+        A cached URI can be revoked or lapse before its advertised expiry, so
+        a failed transfer always evicts the entry it used; when that entry
+        came from the cache, the transfer is retried once against a freshly
+        fetched URI before the error is surfaced.
+        """
+        cached = self._cached_uri_result(cache_key)
+        result = cached if cached is not None else fetch()
+        try:
+            transfer(result)
+        except (HTTPStatusError, EnrichedException):
+            # don't let later calls reuse a URI a transfer just failed on
+            self._uri_cache.pop(cache_key, None)
+            if cached is None:
+                raise
+            transfer(fetch())
+
+    async def _transfer_with_uri_retry_async(
+        self,
+        cache_key: tuple,
+        fetch: Callable[[], Awaitable[dict]],
+        transfer: Callable[[dict], Awaitable[None]],
+    ) -> None:
+        """Async counterpart of :meth:`_transfer_with_uri_retry`."""
+        cached = self._cached_uri_result(cache_key)
+        result = cached if cached is not None else await fetch()
+        try:
+            await transfer(result)
+        except (HTTPStatusError, EnrichedException):
+            self._uri_cache.pop(cache_key, None)
+            if cached is None:
+                raise
+            await transfer(await fetch())
+
+    def _cache_bucket_id(self, cache_key: tuple, bucket_id: int) -> int:
+        if len(self._bucket_id_cache) >= _BUCKET_ID_CACHE_MAX:
+            # drop the oldest entry; insertion order doubles as age
+            self._bucket_id_cache.pop(next(iter(self._bucket_id_cache)))
+        self._bucket_id_cache[cache_key] = bucket_id
+        return bucket_id
+
+    def _resolve_bucket_id(
+        self,
+        *,
+        name: Optional[str],
+        key: Optional[str],
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+    ) -> int:
+        cache_key = (name, key, folder_key, folder_path)
+        bucket_id = self._bucket_id_cache.get(cache_key)
+        if bucket_id is not None:
+            return bucket_id
+        bucket = self.retrieve(
+            name=name, key=key, folder_key=folder_key, folder_path=folder_path
+        )
+        return self._cache_bucket_id(cache_key, bucket.id)
+
+    async def _resolve_bucket_id_async(
+        self,
+        *,
+        name: Optional[str],
+        key: Optional[str],
+        folder_key: Optional[str],
+        folder_path: Optional[str],
+    ) -> int:
+        cache_key = (name, key, folder_key, folder_path)
+        bucket_id = self._bucket_id_cache.get(cache_key)
+        if bucket_id is not None:
+            return bucket_id
+        bucket = await self.retrieve_async(
+            name=name, key=key, folder_key=folder_key, folder_path=folder_path
+        )
+        return self._cache_bucket_id(cache_key, bucket.id)
+
+    @property
+    def custom_headers(self) -> Dict[str, str]:
+        return self.folder_headers
+
+    def _retrieve_spec(
+        self,
+        name: str,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> RequestSpec:
+        return RequestSpec(
+            method="GET",
+            endpoint=Endpoint("/orchestrator_/odata/Buckets"),
+            params={"$filter": f"Name eq '{name}'", "$top": 1},
+            headers=_folder_headers(folder_key, folder_path),
+        )
+
+    def _retrieve_readUri_spec(
+        self,
+        bucket_id: int,
+        blob_file_path: str,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> RequestSpec:
+        return RequestSpec(
+            method="GET",
+            endpoint=_read_uri_endpoint(bucket_id),
+            params={"path": blob_file_path},
+            headers=_folder_headers(folder_key, folder_path),
+        )
+
+    def _retrieve_writeri_spec(
+        self,
+        bucket_id: int,
+        content_type: str,
+        blob_file_path: str,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> RequestSpec:
+        return RequestSpec(
+            method="GET",
+            endpoint=_write_uri_endpoint(bucket_id),
+            params={"path": blob_file_path, "contentType": content_type},
+            headers=_folder_headers(folder_key, folder_path),
+        )
+
+    def _retrieve_by_key_spec(
+        self,
+        key: str,
+        folder_key: Optional[str] = None,
+        folder_path: Optional[str] = None,
+    ) -> RequestSpec:
+        return RequestSpec(
+            method="GET",
+            endpoint=Endpoint(
+                f"/orchestrator_/odata/Buckets/UiPath.Server.Configuration.OData.GetByKey(identifier={key})"
+            ),
+            headers=_folder_headers(folder_key, folder_path),
+        )
@@ -0,0 +1,24 @@
+import importlib.metadata
+
+from .constants import HEADER_USER_AGENT
+
+# Resolved once at import: prefer the embedded package attribute, which avoids
+# the filesystem walk that reading METADATA from disk incurs on first use.
+try:
+    from uipath import __version__ as _VERSION  # type: ignore[attr-defined]
+except Exception:
+    try:
+        _VERSION = importlib.metadata.version("uipath")
+    except importlib.metadata.PackageNotFoundError:
+        _VERSION = "unknown"
+
+
+def user_agent_value(specific_component: str) -> str:
+    product = "UiPath.Python.Sdk"
+    product_component = f"UiPath.Python.Sdk.Activities.{specific_component}"
+
+    return f"{product}/{product_component}/{_VERSION}"
+
+
+def header_user_agent(specific_component: str) -> dict[str, str]:
+    return {HEADER_USER_AGENT: user_agent_value(specific_component)}
@@ -0,0 +1,22 @@
+class BaseUrlMissingError(Exception):
+    __slots__ = ("message",)
+
+    _DEFAULT_MESSAGE = (
+        "Authentication required. Please run \033[1muipath auth\033[22m."
+    )
+
+    def __init__(self, message=None):
+        self.message = message or self._DEFAULT_MESSAGE
+        super().__init__(self.message)
+
+
+class SecretMissingError(Exception):
+    __slots__ = ("message",)
+
+    _DEFAULT_MESSAGE = (
+        "Authentication required. Please run \033[1muipath auth\033[22m."
+    )
+
+    def __init__(self, message=None):
+        self.message = message or self._DEFAULT_MESSAGE
+        super().__init__(self.message)
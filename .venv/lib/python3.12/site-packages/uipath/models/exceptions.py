@@ -0,0 +1,44 @@
+from typing import Optional
+
+from httpx import HTTPStatusError
+
+
+class IngestionInProgressException(Exception):
+    """An exception that is triggered when a search is attempted on an index that is currently undergoing ingestion."""
+
+    __slots__ = ("message",)
+
+    def __init__(self, index_name: Optional[str], search_operation: bool = True):
+        index_name = index_name or "Unknown index name"
+        if search_operation:
+            self.message = f"index '{index_name}' cannot be searched during ingestion"
+        else:
+            self.message = f"index '{index_name}' is currently queued for ingestion"
+        super().__init__(self.message)
+
+
+class EnrichedException(Exception):
+    __slots__ = ()
+
+    _MAX_CONTENT_BYTES = 4096
+
+    def __init__(self, error: HTTPStatusError) -> None:
+        # Extract the relevant details from the HTTPStatusError
+        status_code = error.response.status_code if error.response else "Unknown"
+        url = str(error.request.url) if error.request else "Unknown"
+        # `response.text` is decoded once and cached by httpx, so callers that
+        # also log it elsewhere pay for the decode only once. Truncate so a
+        # large error body does not balloon the message.
+        text = error.response.text if error.response is not None else ""
+        response_content = text[: self._MAX_CONTENT_BYTES] or "No content"
+        if len(text) > self._MAX_CONTENT_BYTES:
+            response_content += "..."
+
+        enriched_message = (
+            f"\nRequest URL: {url}"
+            f"\nStatus Code: {status_code}"
+            f"\nResponse Content: {response_content}"
+        )
+
+        # Initialize the parent Exception class with the formatted message
+        super().__init__(enriched_message)
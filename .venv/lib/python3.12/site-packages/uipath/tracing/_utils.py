@@ -0,0 +1,466 @@
+import functools
+import inspect
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from os import environ as env
+from typing import Any, Dict, Optional, Sequence
+
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.trace import StatusCode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(obj: Any, default: Any = None) -> str:
+    """Serialize to a JSON string, using orjson when available.
+
+    orjson encodes several times faster than stdlib json on the per-span
+    payloads this module produces.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode()
+    return json.dumps(obj, default=default)
+
+# Environment-derived span defaults, read once on first span construction
+# instead of once per span instantiation. Deliberately not a module-level
+# snapshot: this module is imported (via the service @traced decorators)
+# before the CLI runs load_dotenv, so an import-time read would pin empty
+# org/tenant ids for the whole run. The values do not change once a job is
+# underway, so one cached read suffices.
+@functools.lru_cache(maxsize=1)
+def _env_span_defaults() -> tuple:
+    return (
+        env.get("UIPATH_ORGANIZATION_ID", ""),
+        env.get("UIPATH_TENANT_ID", ""),
+        env.get("UIPATH_FOLDER_KEY_XYZ", ""),
+        env.get("UIPATH_PROCESS_UUID"),
+        env.get("UIPATH_JOB_KEY"),
+    )
+
+# Fused masks for stamping the UUID4 version (bits 76-79) and RFC 4122
+# variant (bits 62-63) in one AND + one OR
+_UUID4_CLEAR = ~((0xF << 76) | (0x3 << 62)) & ((1 << 128) - 1)
+_UUID4_SET = (0x4 << 76) | (0x2 << 62)
+
+# Fixed key order for UiPathSpan.to_dict; zipped against a value tuple so the
+# 19 key strings are not re-interned into a fresh literal per span
+_SPAN_DICT_KEYS = (
+    "Id",
+    "TraceId",
+    "ParentId",
+    "Name",
+    "StartTime",
+    "EndTime",
+    "Attributes",
+    "Status",
+    "CreatedAt",
+    "UpdatedAt",
+    "OrganizationId",
+    "TenantId",
+    "ExpiryTimeUtc",
+    "FolderKey",
+    "Source",
+    "SpanType",
+    "ProcessKey",
+    "JobKey",
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _sec_to_iso(sec: int) -> str:
+    """ISO-format the second-granular part of a timestamp, cached per second."""
+    tm = time.localtime(sec)
+    return (
+        f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+        f"T{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+    )
+
+
+def _ns_to_iso(ns: int) -> str:
+    """Format a nanosecond timestamp as an ISO-8601 string.
+
+    Avoids constructing a `datetime` per span; spans emitted within the same
+    second share the cached second-granular prefix.
+    """
+    sec, ns_rem = divmod(ns, 1_000_000_000)
+    return f"{_sec_to_iso(sec)}.{ns_rem // 1000:06d}"
+
+
+@dataclass(slots=True)
+class UiPathSpan:
+    """Represents a span in the UiPath tracing system."""
+
+    id: uuid.UUID
+    trace_id: uuid.UUID
+    name: str
+    attributes: str
+    parent_id: Optional[uuid.UUID] = None
+    start_time: str = ""
+    end_time: str = ""
+    status: int = 1
+    created_at: str = ""
+    updated_at: str = ""
+    organization_id: Optional[str] = field(
+        default_factory=lambda: _env_span_defaults()[0]
+    )
+    tenant_id: Optional[str] = field(default_factory=lambda: _env_span_defaults()[1])
+    expiry_time_utc: Optional[str] = None
+    folder_key: Optional[str] = field(default_factory=lambda: _env_span_defaults()[2])
+    source: Optional[str] = None
+    span_type: str = "Coded Agents"
+    process_key: Optional[str] = field(default_factory=lambda: _env_span_defaults()[3])
+    job_key: Optional[str] = field(default_factory=lambda: _env_span_defaults()[4])
+    _id_str: str = field(init=False, repr=False, compare=False, default="")
+    _trace_id_str: str = field(init=False, repr=False, compare=False, default="")
+    _parent_id_str: Optional[str] = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        # Timestamp fields default to the construction moment; sample the
+        # clock once instead of once per field
+        if not (self.start_time and self.end_time and self.created_at and self.updated_at):
+            now = datetime.now().isoformat()
+            if not self.start_time:
+                self.start_time = now
+            if not self.end_time:
+                self.end_time = now
+            if not self.created_at:
+                self.created_at = now + "Z"
+            if not self.updated_at:
+                self.updated_at = now + "Z"
+
+        # Stringify the UUIDs once; `str(UUID)` allocates a fresh 36-char
+        # string per call and `to_dict` may run more than once per span.
+        self._id_str = str(self.id)
+        self._trace_id_str = str(self.trace_id)
+        self._parent_id_str = str(self.parent_id) if self.parent_id else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the Span to a dictionary suitable for JSON serialization."""
+        return dict(
+            zip(
+                _SPAN_DICT_KEYS,
+                (
+                    self._id_str,
+                    self._trace_id_str,
+                    self._parent_id_str,
+                    self.name,
+                    self.start_time,
+                    self.end_time,
+                    self.attributes,
+                    self.status,
+                    self.created_at,
+                    self.updated_at,
+                    self.organization_id,
+                    self.tenant_id,
+                    self.expiry_time_utc,
+                    self.folder_key,
+                    self.source,
+                    self.span_type,
+                    self.process_key,
+                    self.job_key,
+                ),
+            )
+        )
+
+
+class _SpanUtils:
+    @staticmethod
+    def span_id_to_uuid4(span_id: int) -> uuid.UUID:
+        """Convert a 64-bit span ID to a valid UUID4 format.
+
+        Creates a UUID where:
+        - The 64 least significant bits contain the span ID
+        - The UUID version (bits 48-51) is set to 4
+        - The UUID variant (bits 64-65) is set to binary 10
+        """
+        # Generate deterministic high bits from the span_id with a SplitMix64
+        # mix; unlike seeding random.Random per span, this avoids initializing
+        # a Mersenne-Twister state on every call while staying deterministic.
+        mask64 = 0xFFFFFFFFFFFFFFFF
+        x = (span_id + 0x9E3779B97F4A7C15) & mask64
+        x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & mask64
+        x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & mask64
+        high_bits = x ^ (x >> 31)
+
+        # Combine high bits and span ID into a 128-bit integer
+        combined = (high_bits << 64) | span_id
+
+        return uuid.UUID(int=(combined & _UUID4_CLEAR) | _UUID4_SET)
+
+    @staticmethod
+    def trace_id_to_uuid4(trace_id: int) -> uuid.UUID:
+        """Convert a 128-bit trace ID to a valid UUID4 format.
+
+        Modifies the trace ID to conform to UUID4 requirements:
+        - The UUID version (bits 48-51) is set to 4
+        - The UUID variant (bits 64-65) is set to binary 10
+        """
+        # The int= constructor skips hex formatting and re-parsing
+        return uuid.UUID(int=(trace_id & _UUID4_CLEAR) | _UUID4_SET)
+
+    @staticmethod
+    def otel_span_to_uipath_span(otel_span: ReadableSpan) -> UiPathSpan:
+        """Convert an OpenTelemetry span to a UiPathSpan."""
+        # Extract the context information from the OTel span
+        span_context = otel_span.get_span_context()
+
+        # OTel uses hexadecimal strings, we need to convert to UUID. When the
+        # environment pins the trace/parent IDs, skip the conversion whose
+        # result would be discarded anyway.
+        span_id = _SpanUtils.span_id_to_uuid4(span_context.span_id)
+
+        trace_id_str = env.get("UIPATH_TRACE_ID")
+        if trace_id_str:
+            trace_id = uuid.UUID(trace_id_str)
+        else:
+            trace_id = _SpanUtils.trace_id_to_uuid4(span_context.trace_id)
+
+        parent_span_id_str = env.get("UIPATH_PARENT_SPAN_ID")
+        if parent_span_id_str:
+            parent_id = uuid.UUID(parent_span_id_str)
+        elif otel_span.parent is not None:
+            parent_id = _SpanUtils.span_id_to_uuid4(otel_span.parent.span_id)
+        else:
+            parent_id = None
+
+        # Convert attributes to a format compatible with UiPathSpan in a
+        # single pass over the (possibly bounded) attribute view
+        attributes_dict: dict[str, Any] = {
+            k: v
+            for k, v in (otel_span.attributes.items() if otel_span.attributes else ())
+        }
+
+        # Map status
+        status = 1  # Default to OK
+        if otel_span.status.status_code == StatusCode.ERROR:
+            status = 2  # Error
+            attributes_dict["error"] = otel_span.status.description
+
+        # `inputs`/`outputs` arrive already JSON-encoded from the tracing
+        # decorator. Instead of json.loads-ing them only for the final
+        # json.dumps to re-encode them, set the raw strings aside and splice
+        # them verbatim into the serialized attributes below, skipping a full
+        # parse+encode round-trip over the largest attribute payloads.
+        raw_json_fragments: dict[str, str] = {}
+        for key in ("inputs", "outputs"):
+            value = attributes_dict.get(key)
+            if isinstance(value, str) and value[:1] in ("{", "["):
+                raw_json_fragments[key] = attributes_dict.pop(key)
+
+        # Add events as additional attributes if they exist
+        if otel_span.events:
+            events_list = [
+                {
+                    "name": event.name,
+                    "timestamp": event.timestamp,
+                    "attributes": dict(event.attributes) if event.attributes else {},
+                }
+                for event in otel_span.events
+            ]
+            attributes_dict["events"] = events_list
+
+        # Add links as additional attributes if they exist
+        if hasattr(otel_span, "links") and otel_span.links:
+            links_list = [
+                {
+                    "trace_id": link.context.trace_id,
+                    "span_id": link.context.span_id,
+                    "attributes": dict(link.attributes) if link.attributes else {},
+                }
+                for link in otel_span.links
+            ]
+            attributes_dict["links"] = links_list
+
+        span_type_value = attributes_dict.get("span_type", "OpenTelemetry")
+        span_type = str(span_type_value)
+
+        # Create UiPathSpan from OpenTelemetry span
+        start_time = _ns_to_iso(otel_span.start_time or 0)
+
+        if otel_span.end_time is not None:
+            end_time_str = _ns_to_iso(otel_span.end_time)
+        else:
+            end_time_str = datetime.now().isoformat()
+
+        attributes_json = _json_dumps(attributes_dict)
+        if raw_json_fragments:
+            splice = ", ".join(
+                f'"{key}": {value}' for key, value in raw_json_fragments.items()
+            )
+            separator = ", " if len(attributes_json) > 2 else ""
+            attributes_json = f"{attributes_json[:-1]}{separator}{splice}}}"
+
+        return UiPathSpan(
+            id=span_id,
+            trace_id=trace_id,
+            parent_id=parent_id,
+            name=otel_span.name,
+            attributes=attributes_json,
+            start_time=start_time,
+            end_time=end_time_str,
+            status=status,
+            span_type=span_type,
+        )
+
+    @staticmethod
+    def batch_convert(spans: "Sequence[ReadableSpan]") -> "list[Dict[str, Any]]":
+        """Convert a batch of OTel spans into UiPath span dicts in one pass.
+
+        Preallocates the result list so export-size batches avoid repeated
+        list growth; callers encode the whole batch once instead of per span.
+        """
+        converted: list = [None] * len(spans)
+        for index, span in enumerate(spans):
+            converted[index] = _SpanUtils.otel_span_to_uipath_span(span).to_dict()
+        return converted
+
+    @staticmethod
+    def format_args_for_trace_json(
+        signature: inspect.Signature, *args: Any, **kwargs: Any
+    ) -> str:
+        """Return a JSON string of inputs from the function signature."""
+        result = _SpanUtils.format_args_for_trace(signature, *args, **kwargs)
+        return _json_dumps(result, default=str)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _make_binder(signature: inspect.Signature):
+        """Compile a specialized argument binder for a signature.
+
+        `signature.bind_partial(...).apply_defaults()` re-walks the parameter
+        table on every traced call. Since the signature of a decorated
+        function never changes, generate (once per signature) a plain Python
+        function with the same parameter list whose body assembles the result
+        dict directly — the interpreter's own C-level argument binding then
+        replaces the `BoundArguments` machinery. Returns None when the
+        signature cannot be compiled; callers fall back to `bind_partial`.
+        """
+        try:
+            if "result" in signature.parameters:
+                # Would shadow the local the generated body assembles into
+                return None
+            arg_specs = []
+            dict_items = []
+            kwargs_updates = []
+            namespace: Dict[str, Any] = {}
+            needs_kw_marker = False
+            positional_only_seen = False
+            for param in signature.parameters.values():
+                name = param.name
+                if param.kind == inspect.Parameter.VAR_POSITIONAL:
+                    arg_specs.append(f"*{name}")
+                    needs_kw_marker = False
+                    dict_items.append(f'"{name}": {name}')
+                    continue
+                if param.kind == inspect.Parameter.VAR_KEYWORD:
+                    arg_specs.append(f"**{name}")
+                    kwargs_updates.append(f"    result.update({name})")
+                    continue
+                if param.kind == inspect.Parameter.POSITIONAL_ONLY:
+                    positional_only_seen = True
+                    needs_kw_marker = True
+                elif param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                    if positional_only_seen:
+                        arg_specs.append("/")
+                        positional_only_seen = False
+                    needs_kw_marker = True
+                elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+                    if positional_only_seen:
+                        arg_specs.append("/")
+                        positional_only_seen = False
+                    if needs_kw_marker or not arg_specs:
+                        arg_specs.append("*")
+                        needs_kw_marker = False
+                spec = name
+                if param.default is not inspect.Parameter.empty:
+                    default_name = f"_default_{name}"
+                    namespace[default_name] = param.default
+                    spec = f"{name}={default_name}"
+                arg_specs.append(spec)
+                if name not in ("self", "cls"):
+                    dict_items.append(f'"{name}": {name}')
+            if positional_only_seen:
+                arg_specs.append("/")
+            source = (
+                f"def _bind({', '.join(arg_specs)}):\n"
+                f"    result = {{{', '.join(dict_items)}}}\n"
+                + "\n".join(kwargs_updates)
+                + ("\n" if kwargs_updates else "")
+                + "    return result\n"
+            )
+            exec(source, namespace)  # noqa: S102
+            return namespace["_bind"]
+        except Exception:
+            return None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _var_keyword_names(signature: inspect.Signature) -> frozenset:
+        """Names of the **kwargs parameters of a signature, cached per signature.
+
+        Signatures are invariant for a decorated function, so the scan over
+        `signature.parameters` only needs to happen once per function rather
+        than once per traced call.
+        """
+        return frozenset(
+            name
+            for name, param in signature.parameters.items()
+            if param.kind == inspect.Parameter.VAR_KEYWORD
+        )
+
+    @staticmethod
+    def format_args_for_trace(
+        signature: inspect.Signature, *args: Any, **kwargs: Any
+    ) -> Dict[str, Any]:
+        try:
+            """Return a dictionary of inputs from the function signature."""
+            # Complete calls go through the compiled per-signature binder;
+            # incomplete ones (TypeError) fall back to bind_partial below.
+            binder = _SpanUtils._make_binder(signature)
+            if binder is not None:
+                try:
+                    return binder(*args, **kwargs)
+                except TypeError:
+                    pass
+
+            # Create a parameter mapping by partially binding the arguments
+
+            parameter_binding = signature.bind_partial(*args, **kwargs)
+
+            # Fill in default values for any unspecified parameters
+            parameter_binding.apply_defaults()
+
+            # Extract the input parameters, skipping special Python parameters
+            var_kw_names = _SpanUtils._var_keyword_names(signature)
+            result = {}
+            for name, value in parameter_binding.arguments.items():
+                # Skip class and instance references
+                if name in ("self", "cls"):
+                    continue
+
+                # Handle **kwargs parameters specially
+                if name in var_kw_names:
+                    # Flatten nested kwargs directly into the result
+                    if isinstance(value, dict):
+                        result.update(value)
+                else:
+                    # Regular parameter
+                    result[name] = value
+
+            return result
+        except Exception as e:
+            logger.warning(
+                f"Error formatting arguments for trace: {e}. Using args and kwargs directly."
+            )
+            return {"args": args, "kwargs": kwargs}
@@ -0,0 +1,140 @@
+import logging
+import os
+import threading
+from enum import Enum
+from typing import Optional
+
+from uipath._utils._ssl_context import get_shared_httpx_client
+
+loggger = logging.getLogger(__name__)
+
+
+class UiPathEndpoints(Enum):
+    AH_NORMALIZED_COMPLETION_ENDPOINT = "agenthub_/llm/api/chat/completions"
+    AH_PASSTHROUGH_COMPLETION_ENDPOINT = "agenthub_/llm/openai/deployments/{model}/chat/completions?api-version={api_version}"
+    AH_EMBEDDING_ENDPOINT = (
+        "agenthub_/llm/openai/deployments/{model}/embeddings?api-version={api_version}"
+    )
+    AH_CAPABILITIES_ENDPOINT = "agenthub_/llm/api/capabilities"
+
+    NORMALIZED_COMPLETION_ENDPOINT = "llmgateway_/api/chat/completions"
+    PASSTHROUGH_COMPLETION_ENDPOINT = "llmgateway_/openai/deployments/{model}/chat/completions?api-version={api_version}"
+    EMBEDDING_ENDPOINT = (
+        "llmgateway_/openai/deployments/{model}/embeddings?api-version={api_version}"
+    )
+
+
+class EndpointManager:
+    """Manages and caches the UiPath endpoints.
+    This class provides functionality to determine which UiPath endpoints to use based on
+    the availability of AgentHub. It checks for AgentHub capabilities and caches the result
+    to avoid repeated network calls.
+    Class Attributes:
+        _base_url (str): The base URL for UiPath services, retrieved from the UIPATH_URL
+                         environment variable.
+        _agenthub_available (Optional[bool]): Cached result of AgentHub availability check.
+
+    Methods:
+        is_agenthub_available(): Checks if AgentHub is available, caching the result.
+        get_passthrough_endpoint(): Returns the appropriate passthrough completion endpoint.
+        get_normalized_endpoint(): Returns the appropriate normalized completion endpoint.
+        get_embeddings_endpoint(): Returns the appropriate embeddings endpoint.
+    All endpoint methods automatically select between AgentHub and standard endpoints
+    based on availability.
+    """  # noqa: D205
+
+    _base_url = os.getenv("UIPATH_URL", "")
+    _agenthub_available: Optional[bool] = None
+    _capability_check_lock = threading.Lock()
+    _passthrough_endpoint: Optional[str] = None
+    _normalized_endpoint: Optional[str] = None
+    _embeddings_endpoint: Optional[str] = None
+    _capabilities_url: Optional[str] = None
+
+    @classmethod
+    def is_agenthub_available(cls) -> bool:
+        """Check if AgentHub is available and cache the result.
+
+        The double-checked lock ensures concurrent first callers trigger the
+        capability probe at most once instead of each firing an HTTP request.
+        """
+        if cls._agenthub_available is None:
+            with cls._capability_check_lock:
+                if cls._agenthub_available is None:
+                    cls._agenthub_available = cls._check_agenthub()
+        return cls._agenthub_available
+
+    @classmethod
+    def _get_capabilities_url(cls) -> str:
+        """Build (once) and return the AgentHub capabilities URL."""
+        if cls._capabilities_url is None:
+            base_url = os.getenv("UIPATH_URL", "")
+            cls._capabilities_url = f"{base_url.rstrip('/')}/{UiPathEndpoints.AH_CAPABILITIES_ENDPOINT.value}"
+        return cls._capabilities_url
+
+    @classmethod
+    def _check_agenthub(cls) -> bool:
+        """Perform the actual check for AgentHub capabilities."""
+        try:
+            http_client = get_shared_httpx_client()
+            capabilities_url = cls._get_capabilities_url()
+            loggger.debug(f"Checking AgentHub capabilities at {capabilities_url}")
+            response = http_client.get(capabilities_url)
+
+            if response.status_code != 200:
+                return False
+
+            capabilities = response.json()
+
+            # Validate structure and required fields
+            if not isinstance(capabilities, dict) or "version" not in capabilities:
+                return False
+
+            return True
+
+        except Exception as e:
+            loggger.error(f"Error checking AgentHub capabilities: {e}", exc_info=True)
+            return False
+
+    @classmethod
+    def _resolve_endpoints(cls) -> None:
+        """Pick the endpoint strings once availability is known.
+
+        The getters below run once per LLM request, so they return the
+        resolved strings directly instead of re-checking availability and
+        dereferencing enum values every call.
+        """
+        if cls.is_agenthub_available():
+            cls._passthrough_endpoint = (
+                UiPathEndpoints.AH_PASSTHROUGH_COMPLETION_ENDPOINT.value
+            )
+            cls._normalized_endpoint = (
+                UiPathEndpoints.AH_NORMALIZED_COMPLETION_ENDPOINT.value
+            )
+            cls._embeddings_endpoint = UiPathEndpoints.AH_EMBEDDING_ENDPOINT.value
+        else:
+            cls._passthrough_endpoint = (
+                UiPathEndpoints.PASSTHROUGH_COMPLETION_ENDPOINT.value
+            )
+            cls._normalized_endpoint = (
+                UiPathEndpoints.NORMALIZED_COMPLETION_ENDPOINT.value
+            )
+            cls._embeddings_endpoint = UiPathEndpoints.EMBEDDING_ENDPOINT.value
+
+    @classmethod
+    def get_passthrough_endpoint(cls) -> str:
+        if cls._passthrough_endpoint is None:
+            cls._resolve_endpoints()
+        return cls._passthrough_endpoint
+
+    @classmethod
+    def get_normalized_endpoint(cls) -> str:
+        if cls._normalized_endpoint is None:
+            cls._resolve_endpoints()
+        return cls._normalized_endpoint
+
+    @classmethod
+    def get_embeddings_endpoint(cls) -> str:
+        if cls._embeddings_endpoint is None:
+            cls._resolve_endpoints()
+        return cls._embeddings_endpoint